@@ -1,8 +1,17 @@
-from typing import Any, Callable
+import sys
+from typing import Any, Callable, List, Tuple
 
+import structlog
 from autogen import ConversableAgent, register_function
 from pydantic import BaseModel
 
+from ..schema import Metadata, RemotePredictor, Spec
+from ..types import PYDANTIC_V2
+
+__all__ = ["add_tool", "add_tools", "get_tools", "get_workflow", "remove_tool"]
+
+log = structlog.get_logger("cog.agent_adapters.autogen_adapter")
+
 
 def get_workflow(agents: dict[str, ConversableAgent]) -> dict[str, Any]:
     workflow = {"nodes": [], "edges": []}
@@ -31,25 +40,52 @@ def get_workflow(agents: dict[str, ConversableAgent]) -> dict[str, Any]:
                 "target": caller.name,
             }
         )
-        if "tools" in caller.llm_config:
-            for tool in caller.llm_config["tools"]:
-                workflow["nodes"].append(
-                    {
-                        "name": tool["function"]["name"],
-                        "description": tool["function"]["description"],
-                    }
-                )
-                workflow["edges"].append(
-                    {
-                        "source": caller.name,
-                        "target": tool["function"]["name"],
-                    }
-                )
-                
+        tool_fns = [tool["function"] for tool in caller.llm_config.get("tools", ())]
+        workflow["nodes"].extend(
+            {"name": fn["name"], "description": fn["description"]} for fn in tool_fns
+        )
+        workflow["edges"].extend(
+            {"source": caller.name, "target": fn["name"]} for fn in tool_fns
+        )
 
     return workflow
 
 
+def get_tools(agent: ConversableAgent) -> List[RemotePredictor]:
+    """
+    Return the tools registered with an agent as remote predictors.
+    """
+    tools = (getattr(agent, "llm_config", None) or {}).get("tools")
+    if not tools:
+        return []
+
+    return [
+        _make_remote_predictor(
+            tool["function"]["name"], tool["function"]["description"]
+        )
+        for tool in tools
+    ]
+
+
+def _make_remote_predictor(name: str, description: str) -> RemotePredictor:
+    """
+    Build a RemotePredictor for a registered tool. The fields come straight
+    from the agent's own tool config, so validation is skipped.
+    """
+    if PYDANTIC_V2:
+        metadata = Metadata.model_construct(
+            name=name, namespace="unknown", description=description
+        )
+        return RemotePredictor.model_construct(
+            metadata=metadata, spec=Spec.model_construct()
+        )
+
+    metadata = Metadata.construct(
+        name=name, namespace="unknown", description=description
+    )
+    return RemotePredictor.construct(metadata=metadata, spec=Spec.construct())
+
+
 def add_tool(
     name: str,
     desc: str,
@@ -61,23 +97,41 @@ def add_tool(
     Add a tool to this agent executor and update tool partial variables
     """
 
+    add_tools([(name, desc, schema, func)], agents)
+
+
+def add_tools(
+    tools: List[Tuple[str, str, BaseModel, Callable[..., Any]]],
+    agents: dict[str, ConversableAgent],
+) -> None:
+    """
+    Add several (name, desc, schema, func) tools to the agents, resolving the
+    caller and executor only once for the whole batch.
+    """
+
     if len(agents) < 2:
         return
 
-    print(f"Adding tool: {name}")
-
     caller, executor = get_caller_and_executor(agents)
 
-    register_function(
-        func,  # The function to be registered.
-        caller=caller,  # The caller agent can call the calculator.
-        executor=executor,  # The executor agent can execute the calculator.
-        name=name,  # The name of the tool.
-        description=desc,  # The description of the tool.
-    )
+    for name, desc, _, func in tools:
+        log.debug("adding tool", tool=name)
+
+        # tool names are used as keys in the function map and workflow, so
+        # intern them on registration
+        register_function(
+            func,  # The function to be registered.
+            caller=caller,  # The caller agent can call the calculator.
+            executor=executor,  # The executor agent can execute the calculator.
+            name=sys.intern(name),  # The name of the tool.
+            description=desc,  # The description of the tool.
+        )
 
-    num_tools = len(caller.llm_config["tools"])
-    print(f"Agent now has {num_tools} tools")
+    log.debug(
+        "tools added",
+        num_added=len(tools),
+        num_tools=len(caller.llm_config.get("tools", ())),
+    )
 
 
 def get_caller_and_executor(
@@ -86,15 +140,30 @@ def get_caller_and_executor(
     caller = None
     executor = None
 
-    for name, agent in agents.items():
-        # check if agent has attribute llm_config
-        if hasattr(agent, "llm_config") and agent.llm_config:
-            print("setting caller to", name)
-            caller = agent
-        if caller is not None and agent != caller:
-            print("setting executor to", name)
-            executor = agent
-            break
+    if len(agents) == 2:
+        # the common caller/user proxy pairing, no need to loop
+        (name_a, a), (name_b, b) = agents.items()
+        if not getattr(a, "llm_config", None):
+            (name_a, a), (name_b, b) = (name_b, b), (name_a, a)
+        if getattr(a, "llm_config", None):
+            log.debug("resolved tool agents", caller=name_a, executor=name_b)
+            caller, executor = a, b
+    else:
+        # the caller is the first agent with an llm_config, the executor is the
+        # first other agent, wherever it appears relative to the caller
+        for name, agent in agents.items():
+            # check if agent has attribute llm_config
+            if caller is None and getattr(agent, "llm_config", None):
+                log.debug("setting caller", caller=name)
+                caller = agent
+            elif executor is None:
+                log.debug("setting executor", executor=name)
+                executor = agent
+            if caller is not None and executor is not None:
+                break
+
+        if caller is None:
+            executor = None
 
     return caller, executor
 
@@ -106,16 +175,16 @@ def remove_tool(
 ) -> None:
     caller, _ = get_caller_and_executor(agents)
 
-    if (
-        hasattr(caller, "llm_config")
-        and caller.llm_config
-        and "tools" in caller.llm_config
-    ):
+    llm_config = getattr(caller, "llm_config", None)
+    if llm_config and "tools" in llm_config:
         try:
-            num_tools = len(caller.llm_config["tools"])
             caller.update_tool_signature(name, is_remove=True)
-            print(f"Agent now has {num_tools-1} tools")
-        except Exception as e:
-            print(f"Error removing tool {name}: {e}")
+            log.debug(
+                "tool removed",
+                tool=name,
+                num_tools=len(caller.llm_config.get("tools", ())),
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.warning("error removing tool", tool=name, exc_info=True)
     else:
-        print("Agent now has 0 tools")
+        log.debug("agent has no tools", tool=name)
@@ -1,17 +1,21 @@
-from typing import Any, Callable
+import sys
+from typing import Any, Callable, Dict, List, Tuple
 
+import structlog
 from langchain.tools import StructuredTool
 from langchain.tools.render import render_text_description
 from langchain_core.runnables import Runnable
 from langchain_core.utils.function_calling import convert_to_openai_tool
 from pydantic import BaseModel
 
+log = structlog.get_logger("cog.agent_adapters.langchain_adapter")
+
 
 def get_workflow(agents: dict[str, Runnable]) -> dict[str, Any]:
     if len(agents) == 0:
         return {"nodes": [], "edges": []}
     
-    runnable = list(agents.values())[0]
+    runnable = next(iter(agents.values()))
     workflow = {"nodes": [], "edges": []}
     root_name = "AgentExecutor"
 
@@ -20,19 +24,12 @@ def get_workflow(agents: dict[str, Runnable]) -> dict[str, Any]:
 
     workflow["nodes"].append({"name": root_name, "description": "Langchain - "+root_name})
 
-    for tool in runnable.tools:
-        workflow["nodes"].append(
-            {
-                "name": tool.name,
-                "description": tool.description,
-            }
-        )
-        workflow["edges"].append(
-            {
-                "source": root_name,
-                "target": tool.name,
-            }
-        )
+    workflow["nodes"].extend(
+        {"name": tool.name, "description": tool.description} for tool in runnable.tools
+    )
+    workflow["edges"].extend(
+        {"source": root_name, "target": tool.name} for tool in runnable.tools
+    )
 
     return workflow
 
@@ -51,31 +48,163 @@ def add_tool(
     if len(agents) == 0:
         return
 
-    runnable = list(agents.values())[0]
+    runnable = next(iter(agents.values()))
 
-    print(f"Adding tool: {name}")
+    log.debug("adding tool", tool=name)
 
-    tool = StructuredTool.from_function(
-        func=func,
-        name=name,
-        description=desc,
-        args_schema=schema,
-        # tags=tags,
-    )
+    tool = _make_tool(name, desc, schema, func)
 
     # add the tool to the agent executor and update the partial variables
     _update_agent_tooling_internals(tool, runnable)
 
-    print(f"Agent now has {len(runnable.tools)} tools")
+    log.debug("tool added", tool=name, num_tools=len(runnable.tools))
+
+
+def add_tools(
+    tools: List[Tuple[str, str, BaseModel, Callable[..., Any]]],
+    agents: dict[str, Runnable],
+) -> None:
+    """
+    Add several (name, desc, schema, func) tools to this agent executor,
+    updating the tool partial variables once for the whole batch.
+    """
+
+    if len(agents) == 0:
+        return
+
+    for name, desc, schema, func in tools:
+        add_tool_deferred(name, desc, schema, func, agents)
+
+    flush_tools(agents)
+
+
+def add_tool_deferred(
+    name: str,
+    desc: str,
+    schema: BaseModel,
+    func: Callable[..., Any],
+    agents: dict[str, Runnable],
+) -> None:
+    """
+    Add a tool to this agent executor without updating the prompt. Use this
+    when registering many tools at once and call flush_tools afterwards so
+    the prompt is only rewritten once.
+    """
+
+    if len(agents) == 0:
+        return
+
+    runnable = next(iter(agents.values()))
+
+    tool = _make_tool(name, desc, schema, func)
+    runnable.tools.append(tool)
+    _get_tool_index(runnable)[(tool.name, tool.description)] = tool
+    runnable._tools_dirty = True
+
+    log.debug("tool added (deferred)", tool=name, num_tools=len(runnable.tools))
+
+
+def flush_tools(agents: dict[str, Runnable]) -> None:
+    """
+    Update the prompt of each agent executor with any tools added by
+    add_tool_deferred, or removed, since the prompt was last updated.
+    """
+    for runnable in agents.values():
+        if not getattr(runnable, "_tools_dirty", False):
+            continue
+
+        runnable._tools_dirty = False
+        if "agent" not in runnable.__dict__:
+            continue
+
+        _rebuild_rendered_tools_cache(runnable)
+        _update_prompt_tools(runnable)
 
 
 def remove_tool(name: str, desc: str, agents: dict[str, Runnable]) -> None:
     for runnable in agents.values():
-        for tool in runnable.tools:
-            if tool.name == name and tool.description == desc:
-                runnable.tools.remove(tool)
+        tool = _get_tool_index(runnable).pop((name, desc), None)
+        i = None
+        if tool is not None:
+            # match by identity, as tools with equal fields compare equal
+            i = next((i for i, t in enumerate(runnable.tools) if t is tool), None)
+        if i is None:
+            # fall back to a scan for tools added to, or removed from, the
+            # executor directly
+            i = next(
+                (
+                    i
+                    for i, t in enumerate(runnable.tools)
+                    if t.name == name and t.description == desc
+                ),
+                None,
+            )
 
-        print(f"Agent now has {len(runnable.tools)} tools")
+        if i is not None:
+            del runnable.tools[i]
+            # the prompt is brought back in sync on the next add or flush
+            runnable._tools_dirty = True
+
+        log.debug("tool removed", tool=name, num_tools=len(runnable.tools))
+
+
+def _make_tool(
+    name: str, desc: str, schema: BaseModel, func: Callable[..., Any]
+) -> StructuredTool:
+    # The args schema is always given, so construct the tool directly rather
+    # than going through from_function, which inspects func's signature.
+    # Tool names are used as keys throughout the prompt and workflow, so
+    # intern them on registration.
+    return StructuredTool(
+        name=sys.intern(name),
+        description=desc,
+        args_schema=schema,
+        func=func,
+        coroutine=None,
+        # tags=tags,
+    )
+
+
+def _get_tool_index(runnable: Runnable) -> Dict[Tuple[str, str], StructuredTool]:
+    """
+    Return the runnable's (name, description) -> tool index, building it from
+    the current tools on first use.
+    """
+    index = getattr(runnable, "_tool_index", None)
+    if index is None:
+        index = {(t.name, t.description): t for t in runnable.tools}
+        runnable._tool_index = index
+    return index
+
+
+def _to_openai(tool: StructuredTool) -> Dict[str, Any]:
+    """
+    Return the openai tool schema for a tool, converting it only the first
+    time it is seen and caching the result on the tool itself.
+    """
+    schema = getattr(tool, "_openai_schema", None)
+    if schema is None:
+        schema = convert_to_openai_tool(tool)
+        tool._openai_schema = schema
+    return schema
+
+
+def _render(tool: StructuredTool) -> str:
+    """
+    Return the rendered text description for a tool, cached on the tool.
+    """
+    rendered = getattr(tool, "_rendered_description", None)
+    if rendered is None:
+        rendered = render_text_description([tool])
+        tool._rendered_description = rendered
+    return rendered
+
+
+def _rebuild_rendered_tools_cache(runnable: Runnable) -> None:
+    runnable._rendered_tools_cache = [_render(t) for t in runnable.tools]
+    runnable._tool_names_cache = [t.name for t in runnable.tools]
+    # the list the caches were built from, so a replaced list is noticed
+    runnable._cached_tools_list = runnable.tools
 
 
 def _update_agent_tooling_internals(tool: StructuredTool, runnable: Runnable) -> None:
@@ -87,24 +216,109 @@ def _update_agent_tooling_internals(tool: StructuredTool, runnable: Runnable) ->
         return
 
     runnable.tools.append(tool)
+    _get_tool_index(runnable)[(tool.name, tool.description)] = tool
 
     if "agent" not in runnable.__dict__:
         return
 
-    for _, chain_sequence in runnable.__dict__["agent"].runnable:
+    if _is_prompt_in_sync(runnable, tool):
+        _append_prompt_tool(runnable, tool)
+        return
+
+    # first add, pending deferred changes or a replaced agent, so bring the
+    # whole prompt up to date
+    runnable._tools_dirty = False
+    _rebuild_rendered_tools_cache(runnable)
+    _update_prompt_tools(runnable)
+
+
+def _is_prompt_in_sync(runnable: Runnable, tool: StructuredTool) -> bool:
+    """
+    Check whether the agent prompt reflects all of the runnable's tools except
+    `tool`, which was just appended, so it can be updated incrementally. Tools
+    added to, removed from, or replaced on the executor directly change the
+    list or its length, and force a full rewrite.
+    """
+    if getattr(runnable, "_tools_dirty", False):
+        return False
+    tools = runnable.tools
+    if getattr(runnable, "_cached_tools_list", None) is not tools:
+        return False
+    if len(runnable._tool_names_cache) != len(tools) - 1 or tools[-1] is not tool:
+        return False
+    cached = getattr(runnable, "_prompt_components", None)
+    return cached is not None and cached[0] is runnable.__dict__["agent"]
+
+
+def _append_prompt_tool(runnable: Runnable, tool: StructuredTool) -> None:
+    """
+    Add a single tool to an agent prompt that is otherwise up to date,
+    extending the existing tool lists in place.
+    """
+    runnable._rendered_tools_cache.append(_render(tool))
+    runnable._tool_names_cache.append(tool.name)
+    partial_variables = {
+        "tools": "\n".join(runnable._rendered_tools_cache),
+        "tool_names": ", ".join(runnable._tool_names_cache),
+    }
+
+    openai_tool = _to_openai(tool)
+    kwargs_components, partial_components = _get_prompt_components(runnable)
+
+    for component in kwargs_components:
+        component.kwargs.setdefault("tools", []).append(openai_tool)
+
+    for component in partial_components:
+        component.partial_variables = dict(partial_variables)
+
+
+def _update_prompt_tools(runnable: Runnable) -> None:
+    """
+    Write the runnable's current tools into the agent prompt's tool kwargs
+    and partial variables.
+    """
+    openai_tools = [_to_openai(t) for t in runnable.tools]
+    partial_variables = {
+        "tools": "\n".join(runnable._rendered_tools_cache),
+        "tool_names": ", ".join(runnable._tool_names_cache),
+    }
+
+    kwargs_components, partial_components = _get_prompt_components(runnable)
+
+    for component in kwargs_components:
+        # TODO: handle the case where the component has open-ai-functions kwargs
+        component.kwargs = {
+            "tools": list(openai_tools),
+        }
+
+    for component in partial_components:
+        component.partial_variables = dict(partial_variables)
+
+
+def _get_prompt_components(runnable: Runnable) -> Tuple[List[Any], List[Any]]:
+    """
+    Return the components of the agent's chain that carry tool kwargs and
+    prompt partial variables. The chain is only walked again if the runnable's
+    agent has been replaced.
+    """
+    agent = runnable.__dict__["agent"]
+    cached = getattr(runnable, "_prompt_components", None)
+    if cached is not None and cached[0] is agent:
+        return cached[1], cached[2]
+
+    kwargs_components = []
+    partial_components = []
+    for _, chain_sequence in agent.runnable:
         if chain_sequence is None:
             continue
 
         for component in chain_sequence:
-            if hasattr(component, "kwargs"):
-                # TODO: handle the case where the component has open-ai-functions kwargs
-                component.kwargs = {
-                    "tools": [convert_to_openai_tool(t) for t in runnable.tools],
-                }
+            if getattr(component, "kwargs", None) is not None:
+                kwargs_components.append(component)
 
             # check if component has partial variables
-            if hasattr(component, "partial_variables"):
-                component.partial_variables = {
-                    "tools": render_text_description(list(runnable.tools)),
-                    "tool_names": ", ".join([t.name for t in runnable.tools]),
-                }
+            if getattr(component, "partial_variables", None) is not None:
+                partial_components.append(component)
+
+    runnable._prompt_components = (agent, kwargs_components, partial_components)
+    return kwargs_components, partial_components
@@ -87,3 +87,17 @@ def setup_logging(*, log_level: int = logging.NOTSET) -> None:
     # Reconfigure log levels for some overly chatty libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
+
+
+def setup_worker_logging() -> None:
+    """
+    Drop structlog events below COG_LOG_LEVEL in the predictor child process.
+
+    setup_logging is only called in the parent, and structlog's default logger
+    renders every level to stdout, which the child redirects into prediction
+    logs.
+    """
+    log_level = logging.getLevelName(os.environ.get("COG_LOG_LEVEL", "INFO").upper())
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(log_level))
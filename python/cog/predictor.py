@@ -1,22 +1,26 @@
 import builtins
 import enum
+import functools
+import hashlib
 import importlib.util
 import inspect
 import io
 import json
 import os.path
-import subprocess
 import sys
 import types
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import (Annotated, Any, Callable, Dict, List, Optional, Type,
-                    Union, cast, get_type_hints)
+from typing import (Annotated, Any, Callable, Dict, List, Optional, Tuple,
+                    Type, TypeVar, Union, cast, get_type_hints)
 
 import requests
 from opentelemetry import trace
+from opentelemetry.propagate import inject
+from requests.adapters import HTTPAdapter
 
 try:
     from typing import Literal, get_args, get_origin
@@ -29,22 +33,11 @@ from unittest.mock import patch
 import pydantic
 import structlog
 import yaml
-from autogen import ConversableAgent
-from langchain.agents import AgentExecutor
 from pydantic import BaseModel, Field, create_model
 from pydantic.fields import FieldInfo
 # Added in Python 3.9. Can be from typing if we drop support for <3.9
 from typing_extensions import Annotated
 
-from .agent_adapters.autogen_adapter import add_tool as add_tool_autogen
-from .agent_adapters.autogen_adapter import \
-    get_workflow as get_workflow_autogen
-from .agent_adapters.autogen_adapter import remove_tool as remove_tool_autogen
-from .agent_adapters.langchain_adapter import add_tool as add_tool_langchain
-from .agent_adapters.langchain_adapter import \
-    get_workflow as get_workflow_langchain
-from .agent_adapters.langchain_adapter import \
-    remove_tool as remove_tool_langchain
 from .code_xforms import load_module_from_string, strip_model_source_code
 from .errors import ConfigDoesNotExist, PredictorNotSet
 from .schema import RemotePredictor
@@ -55,6 +48,11 @@ from .types import Path as CogPath
 from .types import Secret as CogSecret
 from .types import URLPath
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore
+
 log = structlog.get_logger("cog.server.predictor")
 
 ALLOWED_INPUT_TYPES: List[Type[Any]] = [
@@ -66,6 +64,7 @@ ALLOWED_INPUT_TYPES: List[Type[Any]] = [
     CogPath,
     CogSecret,
 ]
+_ALLOWED_INPUT_TYPES_SET = frozenset(ALLOWED_INPUT_TYPES)
 
 
 class BasePredictor(ABC):
@@ -97,19 +96,46 @@ class BasePredictor(ABC):
         Optional: Explicitly define how your agent should remove tools at runtime.
         """
 
+@functools.lru_cache(maxsize=None)
+def _get_agent_types() -> Tuple[Type[Any], Type[Any]]:
+    """
+    Import the agent framework classes on first use. autogen and langchain
+    pull in large dependency trees, so importing them is kept out of the
+    import of this module.
+    """
+    from autogen import ConversableAgent
+    from langchain.agents import AgentExecutor
+
+    return ConversableAgent, AgentExecutor
+
+
 def get_agent_atomics(predictor: BasePredictor) -> dict[Type[ABC], dict[str, ABC]]:
-    agent_atomics = {ConversableAgent: {}, AgentExecutor: {}}
+    """
+    Return the autogen and langchain agents held as public attributes of the
+    predictor, grouped by framework.
+    """
+    ConversableAgent, AgentExecutor = _get_agent_types()  # pylint: disable=invalid-name
+    autogen_agents: Dict[str, Any] = {}
+    langchain_agents: Dict[str, Any] = {}
     for key, value in predictor.__dict__.items():
-        if isinstance(value, ConversableAgent):
-            agent_atomics[ConversableAgent][key] = value
-        if isinstance(value, AgentExecutor):
-            agent_atomics[AgentExecutor][key] = value
-    return agent_atomics
+        # Private attributes are never agents to expose
+        if key.startswith("_"):
+            continue
+        cls = type(value)
+        if issubclass(cls, ConversableAgent):
+            autogen_agents[key] = value
+        elif issubclass(cls, AgentExecutor):
+            langchain_agents[key] = value
+    return {ConversableAgent: autogen_agents, AgentExecutor: langchain_agents}
+
 
 def get_workflow(predictor: BasePredictor) -> dict[str, Any]:
     """
     Return a graph of agent components and tools.
     """
+    from .agent_adapters import autogen_adapter, langchain_adapter
+
+    ConversableAgent, AgentExecutor = _get_agent_types()  # pylint: disable=invalid-name
     agent_atomics = get_agent_atomics(predictor)
     G = {"nodes": [], "edges": []}
 
@@ -118,11 +144,11 @@ def get_workflow(predictor: BasePredictor) -> dict[str, Any]:
             continue
 
         if type == ConversableAgent:
-            g = get_workflow_autogen(agents)
+            g = autogen_adapter.get_workflow(agents)
             G["nodes"].extend(g["nodes"])
             G["edges"].extend(g["edges"])
         elif type == AgentExecutor:
-            g = get_workflow_langchain(agents)
+            g = langchain_adapter.get_workflow(agents)
             G["nodes"].extend(g["nodes"])
             G["edges"].extend(g["edges"])
 
@@ -136,71 +162,114 @@ def update_agent_tooling(
     Return a dictionary of agents that are capable of using tools. This will
     be used to dynamically add tools to the agents.
     """
+    from .agent_adapters import autogen_adapter, langchain_adapter
+
+    ConversableAgent, AgentExecutor = _get_agent_types()  # pylint: disable=invalid-name
     agent_atomics = get_agent_atomics(predictor)
 
     if remove:
-        remove_tool_autogen(name, desc, agent_atomics[ConversableAgent])
-        remove_tool_langchain(name, desc, agent_atomics[AgentExecutor])
+        autogen_adapter.remove_tool(name, desc, agent_atomics[ConversableAgent])
+        langchain_adapter.remove_tool(name, desc, agent_atomics[AgentExecutor])
     else:
-        add_tool_autogen(name, desc, schema, func, agent_atomics[ConversableAgent])
-        add_tool_langchain(name, desc, schema, func, agent_atomics[AgentExecutor])
+        autogen_adapter.add_tool(
+            name, desc, schema, func, agent_atomics[ConversableAgent]
+        )
+        langchain_adapter.add_tool(
+            name, desc, schema, func, agent_atomics[AgentExecutor]
+        )
 
 
 def _generate_pydantic_models_from_spec(
     openapi_spec: Dict[str, Any], output_file: str = "model.py"
 ):
     """Generate Pydantic models from OpenAPI spec."""
-    # Save OpenAPI spec to a temporary JSON file
-    with open("schema.json", "w") as f:
-        json.dump(openapi_spec, f)
+    # Imported here as the code generator is only needed for remote predictors
+    from datamodel_code_generator import InputFileType, generate
 
-    # Run the datamodel-code-generator subprocess
     # write to model.py and overwrite if it already exists
-    subprocess.run(
-        [
-            "python",
-            "-m",
-            "datamodel_code_generator",
-            "--input",
-            "schema.json",
-            "--input-file-type",
-            "openapi",
-            "--output",
-            output_file,
-        ],
-        check=True,
+    generate(
+        json.dumps(openapi_spec),
+        input_file_type=InputFileType.OpenAPI,
+        output=Path(output_file),
     )
 
-    # Clean up temporary file
-    os.remove("schema.json")
 
-
-def _import_generated_models(output_file: str = "model.py"):
+def _import_generated_models(
+    output_file: str = "model.py", module_name: str = "models"
+) -> types.ModuleType:
     """Dynamically import the generated Pydantic models."""
-    spec = importlib.util.spec_from_file_location("models", output_file)
+    spec = importlib.util.spec_from_file_location(module_name, output_file)
     models = importlib.util.module_from_spec(spec)  # type: ignore
+    # pydantic looks the module up in sys.modules when building generic models
+    sys.modules[module_name] = models
     spec.loader.exec_module(models)  # type: ignore
 
-    # we could also just return the Input and Output models
-    from model import Input, Output
+    return models
 
-    return Input, Output
 
+# Input and Output models and callback signature for remote predictors, keyed
+# by a hash of the OpenAPI spec they were generated from
+_remote_predictor_cache: Dict[bytes, Tuple[Type[Any], Type[Any], inspect.Signature]] = {}
+
+
+def _get_remote_predictor_models(
+    openapi_spec: Dict[str, Any],
+) -> Tuple[Type[Any], Type[Any], inspect.Signature]:
+    """
+    Return the Input and Output models generated from an OpenAPI spec and the
+    signature of a callback taking Input, generating them only once per
+    distinct spec.
+    """
+    key = hashlib.blake2b(
+        json.dumps(openapi_spec, sort_keys=True).encode("utf-8"), digest_size=16
+    ).digest()
+    cached = _remote_predictor_cache.get(key)
+    if cached is None:
+        _generate_pydantic_models_from_spec(openapi_spec)
+        models = _import_generated_models(module_name=f"cog_remote_models_{key.hex()}")
+        cached = (models.Input, models.Output, _get_callback_signature(models.Input))
+        _remote_predictor_cache[key] = cached
+    return cached
 
-def remote_predictor_retrieval_func(pred: RemotePredictor) -> Any:
-    """Generate Pydantic models from OpenAPI spec and return the models."""
-    _generate_pydantic_models_from_spec(pred.spec.predictor_schema)
-    Input, Output = _import_generated_models()
 
-    fields = get_type_hints(Input).items()
-    # Dynamically create the function signature with annotations
+@functools.lru_cache(maxsize=None)
+def _get_type_hints(cls: Type[Any]) -> Dict[str, Any]:
+    return get_type_hints(cls)
+
+
+def _get_callback_signature(cls: Type[Any]) -> inspect.Signature:
+    """
+    Build a function signature with a parameter for each field of `cls`.
+    """
     parameters = [
         inspect.Parameter(
             name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=field_type
         )
-        for name, field_type in fields
+        for name, field_type in _get_type_hints(cls).items()
     ]
-    signature = inspect.Signature(parameters)
+    return inspect.Signature(parameters)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_remote_predictor_http_client() -> requests.Session:
+    """
+    Return the session shared by all remote predictor callbacks, so tool calls
+    reuse pooled connections instead of opening a new one per request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def remote_predictor_retrieval_func(pred: RemotePredictor) -> Any:
+    """Generate Pydantic models from OpenAPI spec and return the models."""
+    Input, Output, signature = _get_remote_predictor_models(
+        pred.spec.predictor_schema
+    )
+
+    url = f"http://localhost:5002/{pred.metadata.namespace}/{pred.metadata.name}/predictions"
 
     def callback(*args, **kwargs) -> Output:
         # Create an instance of the Input model
@@ -211,21 +280,14 @@ def remote_predictor_retrieval_func(pred: RemotePredictor) -> Any:
         with trace.get_tracer("predictor").start_as_current_span("tool_call") as span:
             span.set_attribute("namespace", pred.metadata.namespace)
 
-            url = f"http://localhost:5002/{pred.metadata.namespace}/{pred.metadata.name}/predictions"
-
             # Inject the trace context into the request headers
-            span_context = trace.get_current_span().get_span_context()
-            # Extract trace and span IDs
-            trace_id = span_context.trace_id
-            span_id = span_context.span_id
-            trace_flags = span_context.trace_flags
-
-            headers = {}
-            headers["traceparent"] = (
-                f"00-{trace_id:032x}-{span_id:016x}-{trace_flags:02x}"
-            )
+            headers: Dict[str, str] = {}
+            inject(headers)
 
-            resp = requests.post(url, json=input.dict(), headers=headers)
+            # Bound the connect only: remote predictions can take arbitrarily long
+            resp = _get_remote_predictor_http_client().post(
+                url, json=input.dict(), headers=headers, timeout=(3, None)
+            )
 
             data = resp.json()
 
@@ -235,7 +297,7 @@ def remote_predictor_retrieval_func(pred: RemotePredictor) -> Any:
             return data
 
     callback.__signature__ = signature
-    callback.__annotations__ = {name: field_type for name, field_type in fields}
+    callback.__annotations__ = dict(_get_type_hints(Input))
 
     return Input, Output, callback
 
@@ -256,22 +318,16 @@ def check_method_implementation(subclass, method_name):
     and not inherited from the `BasePredictor` class.
     Returns True if the method is overridden, False otherwise.
     """
-    base_method = getattr(BasePredictor, method_name, None)
-    sub_method = getattr(subclass, method_name, None)
+    # The worker passes the predictor instance, so accept either
+    cls = subclass if inspect.isclass(subclass) else type(subclass)
 
-    if sub_method is None:
-        # Method does not exist in the subclass
-        return False
+    for klass in cls.__mro__:
+        if klass is BasePredictor:
+            return False
+        if method_name in klass.__dict__:
+            return True
 
-    # Compare the source code of the methods, if available
-    try:
-        base_source = inspect.getsource(base_method)  # type: ignore
-        sub_source = inspect.getsource(sub_method)
-
-        return base_source != sub_source
-    except OSError:
-        # Source code not available for comparison
-        return False
+    return False
 
 
 def run_setup(predictor: BasePredictor) -> None:
@@ -293,11 +349,9 @@ def run_setup(predictor: BasePredictor) -> None:
     # TODO: CogFile/CogPath should have subclasses for each of the subtypes
     if weights_url:
         if PYDANTIC_V2:
-            from pydantic import TypeAdapter
-
             for t in [CogFile, CogPath]:
                 try:
-                    weights = TypeAdapter(t).validate_python(weights_url)
+                    weights = _get_type_adapter(t).validate_python(weights_url)
                     break
                 except Exception:  # pylint: disable=broad-except # noqa: S110
                     pass
@@ -336,7 +390,25 @@ def run_setup(predictor: BasePredictor) -> None:
     predictor.setup(weights=weights)  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
+def _get_type_adapter(t: Any) -> Any:
+    """
+    Return a (Pydantic v2) TypeAdapter for `t`, building it only once as
+    TypeAdapter construction is far more expensive than validation.
+    """
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(t)
+
+
 def get_weights_type(setup_function: Callable[[Any], None]) -> Optional[Any]:
+    # Bound methods are created afresh on every attribute access, so cache on
+    # the underlying function
+    return _weights_type_for(getattr(setup_function, "__func__", setup_function))
+
+
+@functools.lru_cache(maxsize=64)
+def _weights_type_for(setup_function: Callable[..., None]) -> Optional[Any]:
     signature = inspect.signature(setup_function)
     if "weights" not in signature.parameters:
         return None
@@ -352,12 +424,15 @@ def get_weights_type(setup_function: Callable[[Any], None]) -> Optional[Any]:
 def load_config() -> CogConfig:
     """
     Reads cog.yaml and returns it as a typed dict.
+
+    The parsed config is cached until cog.yaml changes, so the returned dict
+    is shared between calls and must not be modified.
     """
     # Assumes the working directory is /src
     config_path = os.path.abspath("cog.yaml")
     try:
-        with open(config_path, encoding="utf-8") as fh:
-            config = yaml.safe_load(fh)
+        mtime = os.stat(config_path).st_mtime_ns
+        config = _load_config_cached(config_path, mtime)
     except FileNotFoundError as e:
         raise ConfigDoesNotExist(
             f"Could not find {config_path}",
@@ -365,6 +440,12 @@ def load_config() -> CogConfig:
     return config
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime: int) -> CogConfig:  # pylint: disable=unused-argument
+    with open(config_path, encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=SafeLoader)
+
+
 def load_predictor(config: CogConfig) -> BasePredictor:
     """
     Constructs an instance of the user-defined Predictor class from a config.
@@ -403,13 +484,33 @@ def load_full_predictor_from_file(
 def load_slim_predictor_from_file(
     module_path: str, class_name: str, method_name: str
 ) -> Optional[types.ModuleType]:
-    with open(module_path, encoding="utf-8") as file:
-        source_code = file.read()
-    stripped_source = strip_model_source_code(source_code, class_name, method_name)
+    """
+    Load a module holding only what `class_name` needs to build its
+    `method_name` models. The stripped source is cached until the file
+    changes, but each call executes it into a new module, as building the
+    models modifies the defaults in its signatures.
+    """
+    module_path = os.path.abspath(module_path)
+    mtime = os.stat(module_path).st_mtime_ns
+    stripped_source = _strip_predictor_source_cached(
+        module_path, mtime, class_name, method_name
+    )
     module = load_module_from_string(uuid.uuid4().hex, stripped_source)
     return module
 
 
+@functools.lru_cache(maxsize=32)
+def _strip_predictor_source_cached(
+    module_path: str,
+    mtime: int,  # pylint: disable=unused-argument
+    class_name: str,
+    method_name: str,
+) -> Optional[str]:
+    with open(module_path, encoding="utf-8") as file:
+        source_code = file.read()
+    return strip_model_source_code(source_code, class_name, method_name)
+
+
 def get_predictor(module: types.ModuleType, class_name: str) -> Any:
     predictor = getattr(module, class_name)
     # It could be a class or a function
@@ -418,30 +519,41 @@ def get_predictor(module: types.ModuleType, class_name: str) -> Any:
     return predictor
 
 
-def load_slim_predictor_from_ref(ref: str, method_name: str) -> BasePredictor:
+@functools.lru_cache(maxsize=8)
+def _parse_ref(ref: str) -> Tuple[str, str, str]:
+    """
+    Split a predictor reference like "predict.py:Predictor" into the module
+    path, class name, and module name.
+    """
     module_path, class_name = ref.split(":", 1)
-    module_name = os.path.basename(module_path).split(".py", 1)[0]
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    return module_path, class_name, module_name
+
+
+def load_slim_predictor_from_ref(ref: str, method_name: str) -> BasePredictor:
+    module_path, class_name, module_name = _parse_ref(ref)
     module = None
     try:
         if sys.version_info >= (3, 9):
             module = load_slim_predictor_from_file(module_path, class_name, method_name)
             if not module:
-                log.debug(f"[{module_name}] fast loader returned None")
+                log.debug("fast loader returned None", module=module_name)
         else:
-            log.debug(f"[{module_name}] cannot use fast loader as current Python <3.9")
+            log.debug(
+                "cannot use fast loader as current Python <3.9", module=module_name
+            )
     except Exception as e:  # pylint: disable=broad-exception-caught
-        log.debug(f"[{module_name}] fast loader failed: {e}")
+        log.debug("fast loader failed", module=module_name, error=str(e))
     finally:
         if not module:
-            log.debug(f"[{module_name}] falling back to slow loader")
+            log.debug("falling back to slow loader", module=module_name)
             module = load_full_predictor_from_file(module_path, module_name)
     predictor = get_predictor(module, class_name)
     return predictor
 
 
 def load_predictor_from_ref(ref: str) -> BasePredictor:
-    module_path, class_name = ref.split(":", 1)
-    module_name = os.path.basename(module_path).split(".py", 1)[0]
+    module_path, class_name, module_name = _parse_ref(ref)
     module = load_full_predictor_from_file(module_path, module_name)
     predictor = get_predictor(module, class_name)
     return predictor
@@ -464,7 +576,7 @@ class BaseInput(BaseModel):
         Cleanup any temporary files created by the input.
         """
 
-        for _, value in dict(self).items():
+        for value in self.__dict__.values():
             # Handle URLPath objects specially for cleanup.
             # Also handle pathlib.Path objects, which cog.Path is a subclass of.
             # A pathlib.Path object shouldn't make its way here,
@@ -477,32 +589,82 @@ class BaseInput(BaseModel):
                     pass
 
 
+class _UnsupportedInputType(Exception):
+    def __init__(self, type_: Any) -> None:
+        super().__init__(type_)
+        self.type = type_
+
+
 def validate_input_type(
     type: Type[Any],  # pylint: disable=redefined-builtin
     name: str,
 ) -> None:
-    if type is inspect.Signature.empty:
+    try:
+        _validate_input_type(type)
+    except _UnsupportedInputType as e:
+        if e.type is inspect.Signature.empty:
+            raise TypeError(
+                f"No input type provided for parameter `{name}`. Supported input types are: {_ALLOWED_TYPES_LIST_STR}, or a Union or List of those types."
+            ) from None
         raise TypeError(
-            f"No input type provided for parameter `{name}`. Supported input types are: {readable_types_list(ALLOWED_INPUT_TYPES)}, or a Union or List of those types."
-        )
-    if type not in ALLOWED_INPUT_TYPES:
-        if get_origin(type) is Literal:
-            for t in get_args(type):
-                validate_input_type(builtins.type(t), name)
-        elif get_origin(type) in (Union, List, list) or (
-            hasattr(types, "UnionType") and get_origin(type) is types.UnionType
-        ):  # noqa: E721
-            for t in get_args(type):
-                validate_input_type(t, name)
-        else:
-            if PYDANTIC_V2:
-                # Cog types are exported as `Annotated[Type, ...]`, but `type` is the inner type
-                if hasattr(type, "__module__") and type.__module__ == "cog.types":
-                    return
+            f"Unsupported input type {human_readable_type_name(e.type)} for parameter `{name}`. Supported input types are: {_ALLOWED_TYPES_LIST_STR}, or a Union or List of those types."
+        ) from None
 
-            raise TypeError(
-                f"Unsupported input type {human_readable_type_name(type)} for parameter `{name}`. Supported input types are: {readable_types_list(ALLOWED_INPUT_TYPES)}, or a Union or List of those types."
-            )
+
+def _validate_input_type(type_: Any) -> None:
+    try:
+        if type_ in _ALLOWED_INPUT_TYPES_SET:
+            return
+    except TypeError:
+        # Unhashable, e.g. Annotated with unhashable metadata, so not cacheable
+        _check_input_type(type_)
+        return
+    _check_input_type_cached(type_)
+
+
+def _check_input_type(type_: Any) -> None:
+    """
+    Raise _UnsupportedInputType with the offending type if `type_`, or any
+    type it is composed of, is not a supported input type.
+    """
+    if type_ is inspect.Signature.empty:
+        raise _UnsupportedInputType(type_)
+    origin = get_origin(type_)
+    if origin is Literal:
+        for t in get_args(type_):
+            _validate_input_type(builtins.type(t))
+    elif origin in (Union, List, list) or (
+        hasattr(types, "UnionType") and origin is types.UnionType
+    ):  # noqa: E721
+        for t in get_args(type_):
+            _validate_input_type(t)
+    else:
+        if PYDANTIC_V2:
+            # Cog types are exported as `Annotated[Type, ...]`, but `type` is the inner type
+            if hasattr(type_, "__module__") and type_.__module__ == "cog.types":
+                return
+
+        raise _UnsupportedInputType(type_)
+
+
+# Only successful validations are cached, as lru_cache doesn't store exceptions
+_check_input_type_cached = functools.lru_cache(maxsize=1024)(_check_input_type)
+
+
+if PYDANTIC_V2:
+
+    def _get_field_extra(field: FieldInfo) -> Dict[str, Any]:
+        # https://github.com/pydantic/pydantic/blob/2.7/pydantic/json_schema.py#L1436-L1446
+        # json_schema_extra can be a callable, but we don't set that and users shouldn't set that
+        if not field.json_schema_extra:  # type: ignore
+            field.json_schema_extra = {}  # type: ignore
+        assert isinstance(field.json_schema_extra, dict)  # type: ignore
+        return field.json_schema_extra  # type: ignore
+
+else:
+
+    def _get_field_extra(field: FieldInfo) -> Dict[str, Any]:
+        return field.extra  # type: ignore
 
 
 def get_input_create_model_kwargs(signature: inspect.Signature) -> Dict[str, Any]:
@@ -524,15 +686,7 @@ def get_input_create_model_kwargs(signature: inspect.Signature) -> Dict[str, Any
             else:
                 default = parameter.default
 
-        if PYDANTIC_V2:
-            # https://github.com/pydantic/pydantic/blob/2.7/pydantic/json_schema.py#L1436-L1446
-            # json_schema_extra can be a callable, but we don't set that and users shouldn't set that
-            if not default.json_schema_extra:  # type: ignore
-                default.json_schema_extra = {}  # type: ignore
-            assert isinstance(default.json_schema_extra, dict)  # type: ignore
-            extra = default.json_schema_extra  # type: ignore
-        else:
-            extra = default.extra  # type: ignore
+        extra = _get_field_extra(default)
         extra["x-order"] = order
         order += 1
 
@@ -545,12 +699,8 @@ def get_input_create_model_kwargs(signature: inspect.Signature) -> Dict[str, Any
         # passed automatically as 'enum' in the schema
         if choices:
             if InputType == str and isinstance(choices, Iterable):  # noqa: E721
-
-                class StringEnum(str, enum.Enum):
-                    pass
-
-                InputType = StringEnum(  # pylint: disable=invalid-name
-                    name, [(value, value) for value in choices or []]
+                InputType = enum.Enum(  # pylint: disable=invalid-name
+                    name, [(value, value) for value in choices or []], type=str
                 )
             elif InputType == int:  # noqa: E721
                 InputType = enum.IntEnum(name, {str(value): value for value in choices})  # type: ignore # pylint: disable=invalid-name
@@ -570,6 +720,43 @@ def get_predict(predictor: Any) -> Callable[..., Any]:
     return predictor
 
 
+_T = TypeVar("_T")
+
+
+def _cache_per_method(
+    get_method: Callable[[Any], Callable[..., Any]],
+) -> Callable[[Callable[[Any], _T]], Callable[[Any], _T]]:
+    """
+    Cache the model built by the decorated function per underlying
+    predict/train function, as returned by `get_method`. Models are held
+    weakly keyed so predictor classes aren't kept alive by the cache.
+    """
+
+    def decorator(build: Callable[[Any], _T]) -> Callable[[Any], _T]:
+        cache: "weakref.WeakKeyDictionary[Any, _T]" = weakref.WeakKeyDictionary()
+
+        @functools.wraps(build)
+        def wrapper(predictor: Any) -> _T:
+            method = get_method(predictor)
+            key = getattr(method, "__func__", method)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # not weak-referenceable, so can't be cached
+                return build(predictor)
+
+            model = build(predictor)
+            cache[key] = model
+            return model
+
+        return wrapper
+
+    return decorator
+
+
+@_cache_per_method(get_predict)
 def get_input_type(predictor: BasePredictor) -> Type[BaseInput]:
     """
     Creates a Pydantic Input model from the arguments of a Predictor's predict() method.
@@ -597,6 +784,7 @@ def get_input_type(predictor: BasePredictor) -> Type[BaseInput]:
     )  # type: ignore
 
 
+@_cache_per_method(get_predict)
 def get_output_type(predictor: BasePredictor) -> Type[BaseModel]:
     """
     Creates a Pydantic Output model from the return type annotation of a Predictor's predict() method.
@@ -677,6 +865,7 @@ def get_train(predictor: Any) -> Callable[..., Any]:
     return predictor
 
 
+@_cache_per_method(get_train)
 def get_training_input_type(predictor: BasePredictor) -> Type[BaseInput]:
     """
     Creates a Pydantic Input model from the arguments of a Predictor's train() method.
@@ -703,6 +892,7 @@ def get_training_input_type(predictor: BasePredictor) -> Type[BaseInput]:
     )  # type: ignore
 
 
+@_cache_per_method(get_train)
 def get_training_output_type(predictor: BasePredictor) -> Type[BaseModel]:
     """
     Creates a Pydantic Output model from the return type annotation of a train() method.
@@ -767,7 +957,14 @@ def human_readable_type_name(t: Type[Union[Any, None]]) -> str:
 
     The special case for Cog modules is because the type lives in `cog.types` internally, but just `cog` when included as a dependency.
     """
+    try:
+        return _human_readable_type_name(t)
+    except TypeError:  # unhashable, e.g. Annotated with unhashable metadata
+        return _human_readable_type_name.__wrapped__(t)
 
+
+@functools.lru_cache(maxsize=512)
+def _human_readable_type_name(t: Type[Union[Any, None]]) -> str:
     if hasattr(t, "__module__"):
         module = t.__module__
 
@@ -787,3 +984,6 @@ def human_readable_type_name(t: Type[Union[Any, None]]) -> str:
 
 def readable_types_list(type_list: List[Type[Any]]) -> str:
     return ", ".join(human_readable_type_name(t) for t in type_list)
+
+
+_ALLOWED_TYPES_LIST_STR = readable_types_list(ALLOWED_INPUT_TYPES)
@@ -1,6 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, Literal, Tuple
 
-from attrs import define, field, validators
+from attrs import define
 
 from ..schema import RemotePredictor
 from .telemetry import TraceContext
@@ -8,51 +8,61 @@ from .telemetry import TraceContext
 
 # From worker parent process
 #
-@define
+@define(weakref_slot=False)
 class PredictionInput:
     payload: Dict[str, Any]
     # add trace context to pass traceparent and tracestate to child processes
     trace_context: TraceContext
 
-@define
+@define(weakref_slot=False)
 class PredictorWorkflowRequest:
     pass
 
-@define
+@define(weakref_slot=False)
 class PredictorWorkflowResponse:
     workflow: Dict[str, Any]
 
 
-@define
+@define(weakref_slot=False)
 class RemotePredictorRequest:
     predictor: RemotePredictor
     add: bool = True
 
 
-@define
+@define(weakref_slot=False)
 class Shutdown:
     pass
 
 
 # From predictor child process
 #
-@define
+@define(weakref_slot=False)
 class Log:
     message: str
-    source: str = field(validator=validators.in_(["stdout", "stderr"]))
+    # Not validated at runtime, as a Log is constructed for every line of
+    # output. Producers only ever pass one of these literals.
+    source: Literal["stdout", "stderr"]
 
+    # Log and PredictionOutput are streamed over the worker pipe, so pickle
+    # them as a constructor call rather than the default object-and-state pair
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Log, (self.message, self.source))
 
-@define
+
+@define(weakref_slot=False)
 class PredictionOutput:
     payload: Any
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (PredictionOutput, (self.payload,))
+
 
-@define
+@define(weakref_slot=False)
 class PredictionOutputType:
     multi: bool = False
 
 
-@define
+@define(weakref_slot=False)
 class Done:
     canceled: bool = False
     error: bool = False
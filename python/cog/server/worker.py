@@ -19,6 +19,7 @@ from traceloop.sdk import Traceloop
 from traceloop.sdk.decorators import workflow
 
 from ..json import make_encodeable
+from ..logging import setup_worker_logging
 from ..predictor import (BasePredictor, check_tool_methods_implemented,
                          get_predict, get_workflow, load_predictor_from_ref,
                          remote_predictor_retrieval_func, run_setup,
@@ -322,6 +323,8 @@ class ChildWorker(_spawn.Process):  # type: ignore
         # We use SIGUSR1 to signal an interrupt for cancelation.
         signal.signal(signal.SIGUSR1, self._signal_handler)
 
+        setup_worker_logging()
+
         redirector = StreamRedirector(
             tee=self._tee_output,
             callback=self._stream_write_hook,
@@ -523,10 +526,8 @@ class ChildWorker(_spawn.Process):  # type: ignore
             raise CancelationException()
 
     def _stream_write_hook(self, stream_name: str, data: str) -> None:
-        if stream_name == sys.stdout.name:
-            self._events.send(Log(data, source="stdout"))
-        else:
-            self._events.send(Log(data, source="stderr"))
+        source = "stdout" if stream_name == sys.stdout.name else "stderr"
+        self._events.send(Log(data, source=source))
 
 
 def make_worker(predictor_ref: str, tee_output: bool = True) -> Worker:
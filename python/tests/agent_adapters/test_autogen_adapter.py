@@ -0,0 +1,148 @@
+from autogen import ConversableAgent
+from pydantic import BaseModel
+
+from cog.agent_adapters import autogen_adapter
+from cog.schema import RemotePredictor
+from cog.types import PYDANTIC_V2
+
+LLM_CONFIG = {"config_list": [{"model": "gpt-4", "api_key": "fake"}]}
+
+
+class ToolInput(BaseModel):
+    x: int
+
+
+def tool_func(x: int) -> int:
+    return x
+
+
+def make_agents():
+    assistant = ConversableAgent("assistant", llm_config=dict(LLM_CONFIG))
+    user_proxy = ConversableAgent(
+        "user_proxy", llm_config=False, human_input_mode="NEVER"
+    )
+    return assistant, user_proxy
+
+
+def tool_names(agent):
+    return [tool["function"]["name"] for tool in agent.llm_config.get("tools", [])]
+
+
+TOOLS = [(f"tool{i}", f"Tool number {i}", ToolInput, tool_func) for i in range(3)]
+
+
+def test_get_caller_and_executor():
+    assistant, user_proxy = make_agents()
+
+    for agents in (
+        {"assistant": assistant, "user_proxy": user_proxy},
+        {"user_proxy": user_proxy, "assistant": assistant},
+    ):
+        assert autogen_adapter.get_caller_and_executor(agents) == (
+            assistant,
+            user_proxy,
+        )
+
+    critic = ConversableAgent("critic", llm_config=False, human_input_mode="NEVER")
+    agents = {"user_proxy": user_proxy, "critic": critic, "assistant": assistant}
+    assert autogen_adapter.get_caller_and_executor(agents) == (assistant, user_proxy)
+
+    assert autogen_adapter.get_caller_and_executor(
+        {"user_proxy": user_proxy, "critic": critic}
+    ) == (None, None)
+
+
+def test_get_workflow():
+    assistant, user_proxy = make_agents()
+    agents = {"user_proxy": user_proxy, "assistant": assistant}
+    autogen_adapter.add_tool(*TOOLS[0], agents)
+
+    assert autogen_adapter.get_workflow(agents) == {
+        "nodes": [
+            {"name": "user_proxy", "description": "Autogen - user_proxy"},
+            {"name": "assistant", "description": "Autogen - assistant"},
+            {"name": "tool0", "description": "Tool number 0"},
+        ],
+        "edges": [
+            {"source": "user_proxy", "target": "assistant"},
+            {"source": "assistant", "target": "tool0"},
+        ],
+    }
+
+
+def test_add_and_remove_tool():
+    assistant, user_proxy = make_agents()
+    agents = {"user_proxy": user_proxy, "assistant": assistant}
+
+    for tool in TOOLS:
+        autogen_adapter.add_tool(*tool, agents)
+    assert tool_names(assistant) == ["tool0", "tool1", "tool2"]
+    assert {"tool0", "tool1", "tool2"} <= set(user_proxy.function_map)
+
+    # registering an existing name replaces the tool
+    autogen_adapter.add_tool("tool0", "Replaced", ToolInput, tool_func, agents)
+    assert tool_names(assistant) == ["tool1", "tool2", "tool0"]
+
+    autogen_adapter.remove_tool("tool1", "Tool number 1", agents)
+    assert tool_names(assistant) == ["tool2", "tool0"]
+
+
+def test_get_tools():
+    assistant, user_proxy = make_agents()
+    autogen_adapter.add_tools(
+        TOOLS[:2], {"assistant": assistant, "user_proxy": user_proxy}
+    )
+
+    tools = autogen_adapter.get_tools(assistant)
+    assert all(isinstance(tool, RemotePredictor) for tool in tools)
+    assert [(t.metadata.name, t.metadata.description) for t in tools] == [
+        ("tool0", "Tool number 0"),
+        ("tool1", "Tool number 1"),
+    ]
+    assert all(t.metadata.namespace == "unknown" for t in tools)
+
+    assert autogen_adapter.get_tools(user_proxy) == []
+    assert autogen_adapter.get_tools(object()) == []
+
+
+def test_get_tools_matches_validated_predictor():
+    assistant, user_proxy = make_agents()
+    autogen_adapter.add_tools(
+        TOOLS[:1], {"assistant": assistant, "user_proxy": user_proxy}
+    )
+
+    (tool,) = autogen_adapter.get_tools(assistant)
+    validated = RemotePredictor(
+        metadata={
+            "name": "tool0",
+            "namespace": "unknown",
+            "description": "Tool number 0",
+        },
+        spec={},
+    )
+    if PYDANTIC_V2:
+        assert tool.model_dump() == validated.model_dump()
+    else:
+        assert tool.dict() == validated.dict()
+
+
+def test_add_tools_matches_sequential_add_tool():
+    sequential, sequential_proxy = make_agents()
+    for tool in TOOLS:
+        autogen_adapter.add_tool(
+            *tool, {"assistant": sequential, "user_proxy": sequential_proxy}
+        )
+
+    batched, batched_proxy = make_agents()
+    autogen_adapter.add_tools(
+        TOOLS, {"assistant": batched, "user_proxy": batched_proxy}
+    )
+
+    assert batched.llm_config["tools"] == sequential.llm_config["tools"]
+    assert set(batched_proxy.function_map) == set(sequential_proxy.function_map)
+
+
+def test_add_tools_needs_a_caller_and_executor():
+    assistant, _ = make_agents()
+    autogen_adapter.add_tools(TOOLS, {"assistant": assistant})
+    assert tool_names(assistant) == []
@@ -0,0 +1,224 @@
+from langchain.agents import (
+    AgentExecutor,
+    create_react_agent,
+    create_tool_calling_agent,
+)
+from langchain.tools import StructuredTool
+from langchain.tools.render import render_text_description
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel
+
+from cog.agent_adapters import langchain_adapter
+
+
+class ToolInput(BaseModel):
+    x: int
+
+
+def tool_func(x: int) -> int:
+    return x
+
+
+class FakeToolCallingModel(FakeListChatModel):
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools])
+
+
+def react_executor() -> AgentExecutor:
+    prompt = PromptTemplate.from_template(
+        "Tools: {tools}\nNames: {tool_names}\nQ: {input}\n{agent_scratchpad}"
+    )
+    llm = FakeListChatModel(responses=["Final Answer: hello"])
+    return AgentExecutor(agent=create_react_agent(llm, [], prompt), tools=[])
+
+
+def tool_calling_executor() -> AgentExecutor:
+    prompt = ChatPromptTemplate.from_messages(
+        [("human", "{input}"), ("placeholder", "{agent_scratchpad}")]
+    )
+    llm = FakeToolCallingModel(responses=["hello"])
+    return AgentExecutor(agent=create_tool_calling_agent(llm, [], prompt), tools=[])
+
+
+def prompt_state(executor: AgentExecutor):
+    """
+    Return the tool kwargs and partial variables of every prompt component.
+    """
+    kwargs = []
+    partial_variables = []
+    for _, chain_sequence in executor.agent.runnable:
+        for component in chain_sequence or []:
+            if getattr(component, "kwargs", None) is not None:
+                kwargs.append(component.kwargs.get("tools"))
+            if getattr(component, "partial_variables", None) is not None:
+                partial_variables.append(dict(component.partial_variables))
+    return kwargs, partial_variables
+
+
+def expected_partial_variables(executor: AgentExecutor):
+    return {
+        "tools": render_text_description(list(executor.tools)),
+        "tool_names": ", ".join(t.name for t in executor.tools),
+    }
+
+
+def expected_kwargs(executor: AgentExecutor):
+    return [convert_to_openai_tool(t) for t in executor.tools]
+
+
+TOOLS = [(f"tool{i}", f"Tool number {i}", ToolInput, tool_func) for i in range(3)]
+
+
+def test_add_tool_deferred_updates_prompt_on_flush():
+    executor = react_executor()
+    agents = {"executor": executor}
+    for tool in TOOLS[:2]:
+        langchain_adapter.add_tool_deferred(*tool, agents)
+
+    _, partial_variables = prompt_state(executor)
+    assert partial_variables[0].get("tool_names", "") == ""
+
+    langchain_adapter.flush_tools(agents)
+    assert prompt_state(executor)[1] == [expected_partial_variables(executor)]
+
+    # a pending deferred tool is picked up by the next add_tool
+    langchain_adapter.add_tool_deferred(*TOOLS[2], agents)
+    langchain_adapter.add_tool("tool3", "Tool number 3", ToolInput, tool_func, agents)
+    assert [t.name for t in executor.tools] == ["tool0", "tool1", "tool2", "tool3"]
+    assert prompt_state(executor)[1] == [expected_partial_variables(executor)]
+
+
+def test_remove_then_add_resyncs_prompt():
+    for make_executor in (react_executor, tool_calling_executor):
+        executor = make_executor()
+        agents = {"executor": executor}
+        for tool in TOOLS:
+            langchain_adapter.add_tool(*tool, agents)
+
+        langchain_adapter.remove_tool("tool1", "Tool number 1", agents)
+        assert [t.name for t in executor.tools] == ["tool0", "tool2"]
+
+        langchain_adapter.add_tool(
+            "tool3", "Tool number 3", ToolInput, tool_func, agents
+        )
+        assert [t.name for t in executor.tools] == ["tool0", "tool2", "tool3"]
+
+        assert prompt_state(executor) == (
+            [expected_kwargs(executor)],
+            [expected_partial_variables(executor)],
+        )
+
+
+def test_add_tool_after_tools_changed_on_executor_directly():
+    for make_executor in (react_executor, tool_calling_executor):
+        executor = make_executor()
+        agents = {"executor": executor}
+        langchain_adapter.add_tool(*TOOLS[0], agents)
+
+        executor.tools.append(
+            StructuredTool(
+                name="direct",
+                description="Added directly",
+                args_schema=ToolInput,
+                func=tool_func,
+            )
+        )
+        langchain_adapter.add_tool(*TOOLS[1], agents)
+        assert [t.name for t in executor.tools] == ["tool0", "direct", "tool1"]
+        assert prompt_state(executor) == (
+            [expected_kwargs(executor)],
+            [expected_partial_variables(executor)],
+        )
+
+        executor.tools = []
+        langchain_adapter.add_tool(*TOOLS[2], agents)
+        assert [t.name for t in executor.tools] == ["tool2"]
+        assert prompt_state(executor) == (
+            [expected_kwargs(executor)],
+            [expected_partial_variables(executor)],
+        )
+
+
+def test_remove_tool_removes_the_indexed_tool():
+    executor = react_executor()
+    agents = {"executor": executor}
+    langchain_adapter.add_tool(*TOOLS[0], agents)
+    first = executor.tools[0]
+    langchain_adapter.add_tool(*TOOLS[0], agents)
+    second = executor.tools[1]
+    assert first == second
+
+    # the index holds the most recently added tool of that name and description
+    langchain_adapter.remove_tool("tool0", "Tool number 0", agents)
+    assert len(executor.tools) == 1
+    assert executor.tools[0] is first
+
+
+def test_remove_tool_removed_from_executor_directly():
+    executor = react_executor()
+    agents = {"executor": executor}
+    for tool in TOOLS:
+        langchain_adapter.add_tool(*tool, agents)
+
+    executor.tools = [t for t in executor.tools if t.name != "tool0"]
+    langchain_adapter.remove_tool("tool0", "Tool number 0", agents)
+    assert [t.name for t in executor.tools] == ["tool1", "tool2"]
+
+    langchain_adapter.remove_tool("tool1", "Tool number 1", agents)
+    assert [t.name for t in executor.tools] == ["tool2"]
+
+
+def test_add_tool_updates_prompt():
+    executor = react_executor()
+    for tool in TOOLS:
+        langchain_adapter.add_tool(*tool, {"executor": executor})
+
+    assert [t.name for t in executor.tools] == ["tool0", "tool1", "tool2"]
+    assert prompt_state(executor) == (
+        [expected_kwargs(executor)],
+        [expected_partial_variables(executor)],
+    )
+
+    executor = tool_calling_executor()
+    for tool in TOOLS:
+        langchain_adapter.add_tool(*tool, {"executor": executor})
+
+    assert prompt_state(executor) == (
+        [expected_kwargs(executor)],
+        [expected_partial_variables(executor)],
+    )
+
+
+def test_get_workflow():
+    executor = react_executor()
+    agents = {"executor": executor}
+    langchain_adapter.add_tools(TOOLS[:2], agents)
+
+    workflow = langchain_adapter.get_workflow(agents)
+    assert workflow == {
+        "nodes": [
+            {"name": "AgentExecutor", "description": "Langchain - AgentExecutor"},
+            {"name": "tool0", "description": "Tool number 0"},
+            {"name": "tool1", "description": "Tool number 1"},
+        ],
+        "edges": [
+            {"source": "AgentExecutor", "target": "tool0"},
+            {"source": "AgentExecutor", "target": "tool1"},
+        ],
+    }
+    assert langchain_adapter.get_workflow({}) == {"nodes": [], "edges": []}
+
+
+def test_add_tools_matches_sequential_add_tool():
+    for make_executor in (react_executor, tool_calling_executor):
+        sequential = make_executor()
+        for tool in TOOLS:
+            langchain_adapter.add_tool(*tool, {"executor": sequential})
+
+        batched = make_executor()
+        langchain_adapter.add_tools(TOOLS, {"executor": batched})
+
+        assert [t.name for t in batched.tools] == [t.name for t in sequential.tools]
+        assert prompt_state(batched) == prompt_state(sequential)
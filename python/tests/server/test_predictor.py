@@ -5,6 +5,7 @@ import sys
 import pytest
 
 from cog.predictor import (
+    get_input_type,
     get_predict,
     get_predictor,
     load_full_predictor_from_file,
@@ -65,3 +66,47 @@ def test_fast_slow_signatures(fixture_name, class_name, method_name):
     signature_slow = inspect.signature(predict_slow)
     # compare predict signatures using str representation (good enough) as some custom Fields do not have __eq__
     assert str(signature_fast) == str(signature_slow)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="Requires Python 3.9 or newer")
+def test_slim_predictor_is_reloaded_when_file_changes(tmp_path):
+    module_path = tmp_path / "predict.py"
+    source = """
+class Predictor:
+    def predict(self, text: str) -> str:
+        return text
+"""
+    module_path.write_text(source, encoding="utf-8")
+
+    module = load_slim_predictor_from_file(str(module_path), "Predictor", "predict")
+    again = load_slim_predictor_from_file(str(module_path), "Predictor", "predict")
+    # every load runs in a new module, so predictors don't share defaults
+    assert again is not module
+    assert str(inspect.signature(again.Predictor.predict)) == str(
+        inspect.signature(module.Predictor.predict)
+    )
+
+    module_path.write_text(source.replace("str", "int"), encoding="utf-8")
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    module = load_slim_predictor_from_file(str(module_path), "Predictor", "predict")
+    assert inspect.signature(module.Predictor.predict).return_annotation is int
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="Requires Python 3.9 or newer")
+def test_slim_predictor_defaults_are_not_shared_between_loads():
+    module_path = _fixture_path("input_integer_default")
+
+    # building the input model modifies the Input() defaults of this module
+    module = load_slim_predictor_from_file(module_path, "Predictor", "predict")
+    get_input_type(get_predictor(module, "Predictor"))
+
+    module_fast = load_slim_predictor_from_file(module_path, "Predictor", "predict")
+    module_slow = load_full_predictor_from_file(module_path, module_fast.__name__)
+    signature_fast = inspect.signature(
+        get_predict(get_predictor(module_fast, "Predictor"))
+    )
+    signature_slow = inspect.signature(
+        get_predict(get_predictor(module_slow, "Predictor"))
+    )
+    assert str(signature_fast) == str(signature_slow)
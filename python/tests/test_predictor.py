@@ -1,10 +1,26 @@
+import inspect
 import os
 import sys
 from typing import Optional
 from unittest.mock import patch
 
-from cog import File, Path
-from cog.predictor import get_weights_type, load_predictor_from_ref
+import pydantic
+import pytest
+from pydantic import BaseModel
+
+from cog import BasePredictor, File, Path
+from cog.errors import ConfigDoesNotExist
+from cog.predictor import (
+    _get_callback_signature,
+    check_tool_methods_implemented,
+    get_agent_atomics,
+    get_input_type,
+    get_weights_type,
+    load_config,
+    load_predictor_from_ref,
+    remote_predictor_retrieval_func,
+)
+from cog.schema import RemotePredictor
 
 
 def test_get_weights_type() -> None:
@@ -28,6 +44,129 @@ def test_get_weights_type() -> None:
 
     assert get_weights_type(f) == File
 
+    class Predictor(BasePredictor):
+        def setup(self, weights: Optional[File] = None) -> None:
+            pass
+
+        def predict(self) -> str:
+            return "hello"
+
+    assert get_weights_type(Predictor().setup) == File
+
+
+def test_get_callback_signature() -> None:
+    class Input(BaseModel):
+        text: str
+        n: Optional[int] = None
+
+    signature = _get_callback_signature(Input)
+
+    assert list(signature.parameters) == ["text", "n"]
+    assert signature.parameters["text"].annotation is str
+    assert signature.parameters["n"].annotation == Optional[int]
+
+
+def test_check_tool_methods_implemented() -> None:
+    class Predictor(BasePredictor):
+        def predict(self) -> str:
+            return "hello"
+
+    class ToolPredictor(Predictor):
+        def add_tool(self, name, description, schema, func) -> None:
+            pass
+
+        def remove_tool(self, name) -> None:
+            pass
+
+    class SubToolPredictor(ToolPredictor):
+        pass
+
+    def predict() -> str:
+        return "hello"
+
+    assert not check_tool_methods_implemented(None)
+    assert not check_tool_methods_implemented(Predictor)
+    assert not check_tool_methods_implemented(Predictor())
+    assert not check_tool_methods_implemented(predict)
+    assert check_tool_methods_implemented(ToolPredictor)
+    assert check_tool_methods_implemented(ToolPredictor())
+    assert check_tool_methods_implemented(SubToolPredictor())
+
+
+def test_load_config(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ConfigDoesNotExist):
+        load_config()
+
+    config_path = tmp_path / "cog.yaml"
+    config_path.write_text('predict: "predict.py:Predictor"\n')
+    config = load_config()
+    assert config == {"predict": "predict.py:Predictor"}
+    assert load_config() is config
+
+    # the cached config is dropped when cog.yaml changes
+    config_path.write_text('predict: "predict.py:Predictor"\ntrain: "train.py:train"\n')
+    mtime = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(mtime, mtime))
+    assert load_config() == {
+        "predict": "predict.py:Predictor",
+        "train": "train.py:train",
+    }
+
+
+def test_remote_predictor_retrieval_func(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    def remote_predictor(output_schema):
+        return RemotePredictor(
+            metadata={"name": "pred", "namespace": "ns", "description": "A predictor"},
+            spec={
+                "predictor_schema": {
+                    "openapi": "3.0.2",
+                    "info": {"title": "Cog", "version": "0.1.0"},
+                    "paths": {},
+                    "components": {
+                        "schemas": {
+                            "Input": {
+                                "title": "Input",
+                                "type": "object",
+                                "properties": {
+                                    "text": {"title": "Text", "type": "string"}
+                                },
+                                "required": ["text"],
+                            },
+                            "Output": output_schema,
+                        }
+                    },
+                }
+            },
+        )
+
+    string_pred = remote_predictor({"title": "Output", "type": "string"})
+    object_pred = remote_predictor(
+        {
+            "title": "Output",
+            "type": "object",
+            "properties": {"count": {"title": "Count", "type": "integer"}},
+        }
+    )
+
+    Input, Output, callback = remote_predictor_retrieval_func(string_pred)
+    assert Input(text="hello").text == "hello"
+    assert Output.__name__ == "Output"
+    assert list(inspect.signature(callback).parameters) == ["text"]
+
+    # a different schema gets its own models
+    _, ObjectOutput, _ = remote_predictor_retrieval_func(object_pred)
+    assert ObjectOutput is not Output
+    assert ObjectOutput(count=3).count == 3
+
+    # models and the callback signature are only built once per distinct schema
+    Input2, _, callback2 = remote_predictor_retrieval_func(string_pred)
+    assert Input2 is Input
+    assert callback2 is not callback
+    assert inspect.signature(callback2) is inspect.signature(callback)
+
 
 def test_load_predictor_from_ref_overrides_argv():
     with patch("sys.argv", ["foo.py", "exec", "--giraffes=2", "--eat-cookies"]):
@@ -39,6 +178,50 @@ def test_load_predictor_from_ref_overrides_argv():
         assert sys.argv == ["foo.py", "exec", "--giraffes=2", "--eat-cookies"]
 
 
+def test_get_input_type_is_cached_per_predict_method():
+    predictor = load_predictor_from_ref(_server_fixture_path("input_choices"))
+    other = type(predictor)()
+
+    InputType = get_input_type(predictor)
+
+    assert get_input_type(other) is InputType
+    # choices are popped off the Input() field, so a rebuild would lose them
+    assert InputType(text="foo").text == "foo"
+    with pytest.raises(pydantic.ValidationError):
+        InputType(text="baz")
+
+
+def test_get_agent_atomics_follows_attribute_changes():
+    from autogen import ConversableAgent
+
+    class Predictor(BasePredictor):
+        def setup(self):
+            self.assistant = None
+            self._critic = ConversableAgent("critic", llm_config=False)
+            self.weights = object()
+
+        def predict(self) -> str:
+            return "hello"
+
+    predictor = Predictor()
+    predictor.setup()
+
+    assert get_agent_atomics(predictor)[ConversableAgent] == {}
+
+    # agents created after the first lookup, including ones replacing None
+    predictor.assistant = ConversableAgent("assistant", llm_config=False)
+    predictor.user = ConversableAgent("user", llm_config=False)
+    assert get_agent_atomics(predictor)[ConversableAgent] == {
+        "assistant": predictor.assistant,
+        "user": predictor.user,
+    }
+
+
 def _fixture_path(name):
     test_dir = os.path.dirname(os.path.realpath(__file__))
     return os.path.join(test_dir, f"fixtures/{name}.py") + ":Predictor"
+
+
+def _server_fixture_path(name):
+    test_dir = os.path.dirname(os.path.realpath(__file__))
+    return os.path.join(test_dir, f"server/fixtures/{name}.py") + ":Predictor"